@@ -6,24 +6,178 @@ Versionshistorik:
 2.1.0 - 2025-05-23 - Tillåter flera instanser med unika namn. Namnfältet är nu obligatoriskt i konfigurationen.
 2.1.2 - 2025-05-23 - Förhindrar onödig global omladdning av config entry när options (t.ex. HVAC-läge) ändras,
                      då climate-entiteten hanterar detta live. Detta bör minska "ValueError" för lyssnare.
+2.6.0 - 2026-10-19 - Lade till binary_sensor-plattformen för detektering av öppet fönster.
+2.7.0 - 2026-10-19 - Massprovisionering av zoner via YAML-import och tjänsten bulk_configure.
+                     Hela listan valideras innan något skapas eller uppdateras. YAML skapar bara
+                     saknade zoner; måltemperatur sätts direkt på den laddade climate-entiteten,
+                     eller sparas som väntande om entiteten inte är aktiv.
 """
+import asyncio
 import logging
+from typing import Optional
 
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.components.climate.const import ATTR_MAX_TEMP, ATTR_MIN_TEMP, DEFAULT_MAX_TEMP, DEFAULT_MIN_TEMP
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState, SOURCE_IMPORT
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.typing import ConfigType 
 
-from .const import DOMAIN, CONF_NAME, DEFAULT_TARGET_TEMP, CONF_TARGET_TEMP, DEFAULT_NAME # Importera för migrering
+from .const import (
+    DOMAIN, CONF_NAME, DEFAULT_TARGET_TEMP, CONF_TARGET_TEMP, DEFAULT_NAME, # Importera för migrering
+    CONF_TEMP_SENSOR_ENTITY, CONF_HEATER_SWITCH_ENTITY, CONF_HYSTERESIS, CONF_ZONES,
+    SERVICE_BULK_CONFIGURE, CONF_PENDING_TARGET_TEMP,
+)
+from .config_flow import zone_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["climate"]
+PLATFORMS = ["climate", "binary_sensor"]
+
+ZONE_SCHEMA = vol.Schema({
+    vol.Required(CONF_NAME): cv.string,
+    vol.Optional(CONF_TEMP_SENSOR_ENTITY): cv.entity_domain(["sensor", "input_number"]),
+    vol.Optional(CONF_HEATER_SWITCH_ENTITY): cv.entity_domain("switch"),
+    vol.Optional(CONF_HYSTERESIS): vol.Coerce(float),
+    vol.Optional(CONF_TARGET_TEMP): vol.Coerce(float),
+})
+
+BULK_CONFIGURE_SCHEMA = vol.Schema({
+    vol.Required(CONF_ZONES): vol.All(cv.ensure_list, [ZONE_SCHEMA]),
+})
+
+CONFIG_SCHEMA = vol.Schema({vol.Optional(DOMAIN): BULK_CONFIGURE_SCHEMA}, extra=vol.ALLOW_EXTRA)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(DOMAIN, {})
     _LOGGER.info(f"Golvvarmekontroll-komponenten (domän: {DOMAIN}) registreras.")
+
+    async def _async_handle_bulk_configure(call: ServiceCall) -> None:
+        await async_bulk_configure(hass, call.data[CONF_ZONES])
+
+    hass.services.async_register(DOMAIN, SERVICE_BULK_CONFIGURE, _async_handle_bulk_configure, schema=BULK_CONFIGURE_SCHEMA)
+
+    if DOMAIN in config:
+        hass.async_create_task(_async_import_yaml_zones(hass, config[DOMAIN][CONF_ZONES]))
     return True
 
+async def _async_import_yaml_zones(hass: HomeAssistant, zones: list) -> None:
+    # YAML skapar bara saknade zoner; befintliga ändras i UI:t eller via tjänsten.
+    try:
+        await async_bulk_configure(hass, zones, update_existing=False)
+    except HomeAssistantError as err:
+        _LOGGER.error(f"YAML-import av Golvvarmekontroll-zoner avbruten: {err}")
+
+def _climate_entity_id(hass: HomeAssistant, entry: ConfigEntry) -> Optional[str]:
+    return er.async_get(hass).async_get_entity_id("climate", DOMAIN, f"{entry.entry_id}_thermostat")
+
+def _target_temp_range(hass: HomeAssistant, entry: Optional[ConfigEntry]) -> tuple:
+    """Min/max för måltemperatur: från entitetens tillstånd om den finns, annars climate-standard."""
+    entity_id = _climate_entity_id(hass, entry) if entry is not None else None
+    state = hass.states.get(entity_id) if entity_id else None
+    if state and ATTR_MIN_TEMP in state.attributes and ATTR_MAX_TEMP in state.attributes:
+        return state.attributes[ATTR_MIN_TEMP], state.attributes[ATTR_MAX_TEMP]
+    return DEFAULT_MIN_TEMP, DEFAULT_MAX_TEMP
+
+def _plan_bulk_configure(hass: HomeAssistant, zones: list) -> tuple:
+    """Validera hela listan mot befintliga unika ID:n innan något ändras."""
+    entries_by_unique_id = {entry.unique_id: entry for entry in hass.config_entries.async_entries(DOMAIN)}
+    unique_ids_in_progress = {
+        flow["context"].get("unique_id") for flow in hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    }
+    seen_unique_ids = {}
+    errors = []
+    to_create = []
+    to_update = []
+    for zone in zones:
+        name = zone[CONF_NAME].strip()
+        if not name:
+            errors.append("tomt namn")
+            continue
+        unique_id = zone_unique_id(name)
+        if unique_id in seen_unique_ids:
+            errors.append(f"'{name}' ger samma unika ID som '{seen_unique_ids[unique_id]}' ({unique_id})")
+            continue
+        seen_unique_ids[unique_id] = name
+        zone = {**zone, CONF_NAME: name}
+        entry = entries_by_unique_id.get(unique_id)
+        if CONF_TARGET_TEMP in zone:
+            min_temp, max_temp = _target_temp_range(hass, entry)
+            try:
+                vol.Range(min=min_temp, max=max_temp)(zone[CONF_TARGET_TEMP])
+            except vol.Invalid:
+                errors.append(f"'{name}': {CONF_TARGET_TEMP} {zone[CONF_TARGET_TEMP]} utanför {min_temp}–{max_temp}")
+                continue
+        if entry is not None:
+            to_update.append((entry, zone))
+        elif unique_id in unique_ids_in_progress:
+            errors.append(f"'{name}' håller redan på att konfigureras ({unique_id})")
+        elif CONF_TEMP_SENSOR_ENTITY not in zone or CONF_HEATER_SWITCH_ENTITY not in zone:
+            errors.append(f"ny zon '{name}' saknar {CONF_TEMP_SENSOR_ENTITY} eller {CONF_HEATER_SWITCH_ENTITY}")
+        else:
+            to_create.append(zone)
+    if errors:
+        raise ServiceValidationError(f"Ogiltiga zondefinitioner: {'; '.join(errors)}")
+    return to_create, to_update
+
+async def _async_update_zone(hass: HomeAssistant, entry: ConfigEntry, zone: dict) -> None:
+    """Uppdatera en befintlig zon live, utan omladdning och utan att lyssnare sätts upp på nytt."""
+    new_options = {**entry.options, **{key: value for key, value in zone.items() if key not in (CONF_NAME, CONF_TARGET_TEMP)}}
+    # climate-entitetens update-listener applicerar sensor/switch/hysteres live.
+    hass.config_entries.async_update_entry(entry, options=new_options)
+    if CONF_TARGET_TEMP not in zone:
+        return
+    entity_id = _climate_entity_id(hass, entry)
+    registry_entry = er.async_get(hass).async_get(entity_id) if entity_id else None
+    data_without_pending = {key: value for key, value in entry.data.items() if key != CONF_PENDING_TARGET_TEMP}
+    if entry.state is ConfigEntryState.LOADED and registry_entry is not None and not registry_entry.disabled:
+        _LOGGER.debug(f"bulk_configure: Sätter måltemperatur {zone[CONF_TARGET_TEMP]}°C på {entity_id}")
+        hass.config_entries.async_update_entry(entry, data=data_without_pending)
+        await hass.services.async_call(
+            "climate", "set_temperature",
+            {ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: zone[CONF_TARGET_TEMP]},
+            blocking=True,
+        )
+    else:
+        # Ingen aktiv entitet: climate-entiteten applicerar värdet före återställt tillstånd när den läggs till.
+        _LOGGER.info(f"bulk_configure: '{entry.title}' har ingen aktiv climate-entitet, måltemperatur {zone[CONF_TARGET_TEMP]}°C väntar.")
+        hass.config_entries.async_update_entry(entry, data={**data_without_pending, CONF_PENDING_TARGET_TEMP: zone[CONF_TARGET_TEMP]})
+
+async def _async_create_zone(hass: HomeAssistant, zone: dict) -> Optional[str]:
+    """Skapa en ny zon via import-steget. Returnerar felorsak om flödet inte skapade någon post."""
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_IMPORT}, data=zone)
+    if result["type"] != FlowResultType.CREATE_ENTRY:
+        return f"'{zone[CONF_NAME]}' ({result.get('reason', result['type'])})"
+    return None
+
+async def async_bulk_configure(hass: HomeAssistant, zones: list, update_existing: bool = True) -> None:
+    """Skapa eller uppdatera flera zoner i en omgång.
+
+    Hela listan valideras innan något ändras. Befintliga zoner uppdateras via options
+    och appliceras live av climate-entiteten, så lyssnare behålls och ingen omladdning
+    sker. Måltemperaturen sätts direkt på entiteten, eller väntar tills entiteten läggs
+    till. Nya zoner skapas via import-steget; om ett import-flöde ändå avbryts efter
+    valideringen rapporteras det som fel, men redan gjorda ändringar rullas inte tillbaka.
+    """
+    to_create, to_update = _plan_bulk_configure(hass, zones)
+    if not update_existing:
+        to_update = []
+    _LOGGER.info(f"bulk_configure: {len(to_create)} nya och {len(to_update)} befintliga zoner.")
+    for entry, zone in to_update:
+        await _async_update_zone(hass, entry, zone)
+    if not to_create:
+        return
+    failures = [
+        failure for failure in await asyncio.gather(*(_async_create_zone(hass, zone) for zone in to_create))
+        if failure
+    ]
+    if failures:
+        raise HomeAssistantError(f"Följande zoner kunde inte skapas: {'; '.join(failures)}")
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info(f"Sätter upp Golvvarmekontroll-post '{entry.title}' (v{entry.version}, ID: {entry.entry_id})")
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -39,6 +193,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info(f"Laddar ur Golvvarmekontroll-post '{entry.title}' (ID: {entry.entry_id})")
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
         _LOGGER.info(f"Golvvarmekontroll-post '{entry.title}' har laddats ur framgångsrikt.")
     else:
         _LOGGER.error(f"Misslyckades med att ladda ur plattformar för Golvvarmekontroll-post '{entry.title}'.")
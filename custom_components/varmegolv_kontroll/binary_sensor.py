@@ -0,0 +1,54 @@
+"""
+Binary sensor-plattform för Golvvärmekontroll.
+
+Versionshistorik:
+2.6.0 - 2026-10-19 - Initialversion. Exponerar detektering av öppet fönster per zon.
+"""
+import logging
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SIGNAL_OPEN_WINDOW, DATA_OPEN_WINDOW, zone_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+async def async_setup_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback,
+) -> None:
+    _LOGGER.info(f"Sätter upp binary_sensor för öppet fönster för '{config_entry.title}' ({config_entry.entry_id})")
+    async_add_entities([VarmegolvOpenWindowBinarySensor(config_entry)])
+
+class VarmegolvOpenWindowBinarySensor(BinarySensorEntity):
+    _attr_has_entity_name = True
+    _attr_translation_key = "open_window"
+    _attr_device_class = BinarySensorDeviceClass.WINDOW
+    _attr_should_poll = False
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        self._config_entry = config_entry
+        self._attr_unique_id = f"{config_entry.entry_id}_open_window"
+        self._attr_is_on = False
+
+    @property
+    def device_info(self):
+        return zone_device_info(self._config_entry)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Läs aktuell status så att en pågående paus syns även om entiteten läggs till sent.
+        self._attr_is_on = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id, {}).get(DATA_OPEN_WINDOW, False)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_OPEN_WINDOW.format(self._config_entry.entry_id), self._async_open_window_changed
+            )
+        )
+
+    @callback
+    def _async_open_window_changed(self, detected: bool) -> None:
+        _LOGGER.debug(f"[{self._config_entry.title}] Öppet fönster-status ändrad till {detected}.")
+        self._attr_is_on = detected
+        self.async_write_ha_state()
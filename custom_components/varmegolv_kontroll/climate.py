@@ -6,6 +6,10 @@ Versionshistorik:
 2.2.1 - 2025-05-23 - Explicit _attr_name = None i climate.py för tydlighet i namngivning.
 2.2.2 - 2025-05-24 - Fix: Korrigerat TypeError i _perform_initial_updates_and_control
                      genom att ta bort felaktigt 'await' på synkron funktion.
+2.6.0 - 2026-10-19 - Detektering av öppet fönster: glidande regression över temperaturen
+                     pausar värmen en konfigurerbar tid vid snabbt temperaturfall. Statusen
+                     sparas i hass.data så att binary_sensor kan läsa den när den läggs till.
+2.7.0 - 2026-10-19 - Väntande måltemperatur från bulk_configure appliceras före återställt tillstånd.
 """
 import logging
 import functools
@@ -20,14 +24,19 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_START,
 )
 from homeassistant.core import HomeAssistant, callback, Event, State
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
     DOMAIN, CONF_TEMP_SENSOR_ENTITY, CONF_HEATER_SWITCH_ENTITY, CONF_HYSTERESIS,
     CONF_MASTER_ENABLED, CONF_TARGET_TEMP, DEFAULT_HYSTERESIS, DEFAULT_TARGET_TEMP,
+    CONF_WINDOW_SLOPE_THRESHOLD, CONF_WINDOW_DETECTION_MINUTES, CONF_WINDOW_PAUSE_MINUTES,
+    DEFAULT_WINDOW_SLOPE_THRESHOLD, DEFAULT_WINDOW_DETECTION_MINUTES, DEFAULT_WINDOW_PAUSE_MINUTES,
+    SIGNAL_OPEN_WINDOW, DATA_OPEN_WINDOW, zone_device_info, CONF_PENDING_TARGET_TEMP,
 )
+from .window_detection import SlidingSlope
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,11 +75,20 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
         self._attr_hvac_mode: HVACMode = HVACMode.HEAT if initial_master_enabled else HVACMode.OFF
         self._attr_hvac_action: Optional[HVACAction] = None
         self._listeners = []
+        self._load_window_detection_config()
+        self._window_slope = SlidingSlope(self._window_detection_minutes)
+        self._open_window_detected = False
+        self._open_window_pause_unsub = None
         _LOGGER.debug(f"[{self._config_entry.title}] __init__: TargetTemp={self._target_temp}, HVACMode={self._attr_hvac_mode}")
 
+    def _load_window_detection_config(self) -> None:
+        self._window_slope_threshold = float(self._config_data.get(CONF_WINDOW_SLOPE_THRESHOLD, DEFAULT_WINDOW_SLOPE_THRESHOLD))
+        self._window_detection_minutes = float(self._config_data.get(CONF_WINDOW_DETECTION_MINUTES, DEFAULT_WINDOW_DETECTION_MINUTES))
+        self._window_pause_minutes = float(self._config_data.get(CONF_WINDOW_PAUSE_MINUTES, DEFAULT_WINDOW_PAUSE_MINUTES))
+
     @property
     def device_info(self):
-        return {"identifiers": {(DOMAIN, self._config_entry.entry_id)}, "name": self._config_entry.title, "manufacturer": "Anpassad Komponent AB", "model": "Golvvärmetermostat v2.2", "sw_version": self._config_entry.version}
+        return zone_device_info(self._config_entry)
     @property
     def current_temperature(self) -> Optional[float]: return self._current_temp
     @property
@@ -110,6 +128,12 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
             _LOGGER.debug(f"[{self._config_entry.title}] Inget last_state, använder initiala konfigurationsvärden.")
             self._target_temp = initial_target_temp_from_config
             self._attr_hvac_mode = HVACMode.HEAT if initial_master_enabled_from_config else HVACMode.OFF
+        pending_target_temp = self._config_entry.data.get(CONF_PENDING_TARGET_TEMP)
+        if pending_target_temp is not None:
+            _LOGGER.info(f"[{self._config_entry.title}] Applicerar väntande måltemperatur {pending_target_temp}°C från bulk_configure.")
+            self._target_temp = float(pending_target_temp)
+            new_data = {key: value for key, value in self._config_entry.data.items() if key != CONF_PENDING_TARGET_TEMP}
+            self.hass.config_entries.async_update_entry(self._config_entry, data=new_data)
         _LOGGER.debug(f"[{self._config_entry.title}] Efter återställning/init: TargetTemp={self._target_temp}, HVACMode={self._attr_hvac_mode}")
         self._config_entry.async_on_unload(self._config_entry.add_update_listener(self._async_options_updated))
         self._setup_sensor_listeners()
@@ -146,6 +170,8 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
     async def async_will_remove_from_hass(self) -> None:
         _LOGGER.debug(f"[{self._config_entry.title}] async_will_remove_from_hass: Tar bort lyssnare.")
         self._remove_listeners()
+        if self._open_window_detected:
+            self._end_open_window_pause()
         await super().async_will_remove_from_hass()
 
     def _remove_listeners(self):
@@ -168,6 +194,11 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
             listeners_need_reset = True
             _LOGGER.info(f"[{self._config_entry.title}] Värmeswitch ändrad till: {new_heater_switch}")
         self._hysteresis = self._config_data.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+        self._load_window_detection_config()
+        self._window_slope.window_minutes = self._window_detection_minutes
+        if self._open_window_detected and self._window_slope_threshold <= 0:
+            _LOGGER.info(f"[{self._config_entry.title}] Fönsterdetektering avstängd via options, avslutar pågående paus.")
+            self._end_open_window_pause()
         new_master_enabled_option = self._config_entry.options.get(CONF_MASTER_ENABLED)
         if new_master_enabled_option is not None:
             target_hvac_mode = HVACMode.HEAT if new_master_enabled_option else HVACMode.OFF
@@ -176,6 +207,7 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
                 _LOGGER.info(f"[{self._config_entry.title}] HVAC-läge uppdaterat till {self._attr_hvac_mode} via options-ändring.")
         if listeners_need_reset:
             _LOGGER.debug(f"[{self._config_entry.title}] Återställer sensorlyssnare pga options-ändring.")
+            self._window_slope.reset()
             self._setup_sensor_listeners()
             if self.hass.is_running:
                 await self._perform_initial_updates_and_control()
@@ -205,17 +237,57 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
                     self._current_temp = current_temp
                     _LOGGER.debug(f"[{self._config_entry.title}] Aktuell temperatur {self._current_temp}°C från {self._temp_sensor_entity_id}")
                     changed = True
+                if self._check_open_window(state.last_updated.timestamp(), current_temp):
+                    changed = True
             except ValueError:
                 _LOGGER.warning(f"[{self._config_entry.title}] Kunde inte tolka temp från {self._temp_sensor_entity_id}: {state.state}")
                 if self._current_temp is not None:
                     changed = True
                 self._current_temp = None
+                self._window_slope.reset()
         elif self._current_temp is not None:
             _LOGGER.warning(f"[{self._config_entry.title}] Temperatursensor {self._temp_sensor_entity_id} otillgänglig.")
             self._current_temp = None
+            self._window_slope.reset()
             changed = True
         return changed
 
+    def _check_open_window(self, timestamp: float, temperature: float) -> bool:
+        """Matar regressionen med en ny mätpunkt. Returnerar True om en paus startades."""
+        slope = self._window_slope.add(timestamp, temperature)
+        if self._window_slope_threshold <= 0 or self._open_window_detected or slope is None:
+            return False
+        if -slope < self._window_slope_threshold:
+            return False
+        _LOGGER.info(f"[{self._config_entry.title}] Öppet fönster detekterat: lutning {slope:.3f}°C/min (gräns -{self._window_slope_threshold}°C/min). Pausar värmen i {self._window_pause_minutes} min.")
+        self._window_slope.reset()
+        self._cancel_open_window_pause()
+        self._open_window_pause_unsub = async_call_later(self.hass, self._window_pause_minutes * 60, self._async_open_window_pause_ended)
+        self._set_open_window(True)
+        return True
+
+    def _set_open_window(self, detected: bool) -> None:
+        self._open_window_detected = detected
+        self.hass.data.setdefault(DOMAIN, {}).setdefault(self._config_entry.entry_id, {})[DATA_OPEN_WINDOW] = detected
+        async_dispatcher_send(self.hass, SIGNAL_OPEN_WINDOW.format(self._config_entry.entry_id), detected)
+
+    def _cancel_open_window_pause(self) -> None:
+        if self._open_window_pause_unsub:
+            self._open_window_pause_unsub()
+            self._open_window_pause_unsub = None
+
+    def _end_open_window_pause(self) -> None:
+        self._cancel_open_window_pause()
+        self._window_slope.reset()
+        self._set_open_window(False)
+
+    async def _async_open_window_pause_ended(self, _now) -> None:
+        self._open_window_pause_unsub = None
+        _LOGGER.info(f"[{self._config_entry.title}] Paus för öppet fönster avslutad, återupptar styrning.")
+        self._end_open_window_pause()
+        await self._control_heating()
+        self.async_write_ha_state()
+
     @callback
     def _async_heater_switch_changed(self, event: Event) -> None:
         new_state_obj: Optional[State] = event.data.get("new_state")
@@ -228,12 +300,13 @@ class VarmegolvClimate(ClimateEntity, RestoreEntity):
             _LOGGER.error(f"[{self._config_entry.title}] FEL vid anrop av async_schedule_update_ha_state i _async_heater_switch_changed: {e}", exc_info=True)
 
     async def _control_heating(self) -> None:
-        if self._attr_hvac_mode != HVACMode.HEAT:
-            _LOGGER.debug(f"[{self._config_entry.title}] HVAC-läge {self._attr_hvac_mode}, styr ej värme.")
+        if self._attr_hvac_mode != HVACMode.HEAT or self._open_window_detected:
+            reason = "öppet fönster" if self._attr_hvac_mode == HVACMode.HEAT else f"HVAC-läge {self._attr_hvac_mode}"
+            _LOGGER.debug(f"[{self._config_entry.title}] {reason}, styr ej värme.")
             if self._heater_switch_entity_id:
                 current_heater_state_obj = self.hass.states.get(self._heater_switch_entity_id)
                 if current_heater_state_obj and current_heater_state_obj.state == "on":
-                    _LOGGER.info(f"[{self._config_entry.title}] Termostat är AV, stänger av värmare {self._heater_switch_entity_id}.")
+                    _LOGGER.info(f"[{self._config_entry.title}] Värmen ska vara av ({reason}), stänger av värmare {self._heater_switch_entity_id}.")
                     await self._set_heater_state(False)
             return
         if self._current_temp is None or self._target_temp is None:
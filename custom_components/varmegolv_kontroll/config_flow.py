@@ -8,6 +8,9 @@ Versionshistorik:
                      Titeln på config entry sätts till det angivna namnet.
 2.2.3 - 2026-01-17 - Fix: Tog bort manuell tilldelning av self.config_entry i OptionsFlow
                      för att åtgärda AttributeError (read-only property).
+2.6.0 - 2026-10-19 - Lade till inställningar för detektering av öppet fönster (gräns, fönster, paus).
+2.7.0 - 2026-10-19 - Lade till async_step_import för massprovisionering via YAML och tjänst.
+                     zone_unique_id() är enda stället där det unika ID:t för en zon byggs.
 """
 import logging
 import voluptuous as vol
@@ -25,13 +28,23 @@ from .const import (
     CONF_MASTER_ENABLED,
     CONF_TARGET_TEMP,
     CONF_NAME,
+    CONF_WINDOW_SLOPE_THRESHOLD,
+    CONF_WINDOW_DETECTION_MINUTES,
+    CONF_WINDOW_PAUSE_MINUTES,
     DEFAULT_HYSTERESIS,
     DEFAULT_NAME,
     DEFAULT_TARGET_TEMP,
+    DEFAULT_WINDOW_SLOPE_THRESHOLD,
+    DEFAULT_WINDOW_DETECTION_MINUTES,
+    DEFAULT_WINDOW_PAUSE_MINUTES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+def zone_unique_id(name: str) -> str:
+    """Unikt ID för en zon, härlett från dess namn."""
+    return f"{DOMAIN}_{slugify(name.strip())}"
+
 class VarmegolvConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 2
 
@@ -42,8 +55,7 @@ class VarmegolvConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not name:
                 errors[CONF_NAME] = "name_empty"
             else:
-                unique_id_candidate = f"{DOMAIN}_{slugify(name)}"
-                await self.async_set_unique_id(unique_id_candidate)
+                await self.async_set_unique_id(zone_unique_id(name))
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(title=name, data=user_input)
 
@@ -58,6 +70,9 @@ class VarmegolvConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): vol.Coerce(float),
             vol.Optional(CONF_TARGET_TEMP, default=DEFAULT_TARGET_TEMP): vol.Coerce(float),
             vol.Optional(CONF_MASTER_ENABLED, default=True): bool,
+            vol.Optional(CONF_WINDOW_SLOPE_THRESHOLD, default=DEFAULT_WINDOW_SLOPE_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(CONF_WINDOW_DETECTION_MINUTES, default=DEFAULT_WINDOW_DETECTION_MINUTES): vol.All(vol.Coerce(float), vol.Range(min=1)),
+            vol.Optional(CONF_WINDOW_PAUSE_MINUTES, default=DEFAULT_WINDOW_PAUSE_MINUTES): vol.All(vol.Coerce(float), vol.Range(min=1)),
         })
 
         return self.async_show_form(
@@ -67,6 +82,23 @@ class VarmegolvConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"component_name": "Golvvärmekontroll"},
         )
 
+    async def async_step_import(self, import_data):
+        """Skapa en zon från YAML eller tjänsten bulk_configure (redan validerad)."""
+        name = import_data[CONF_NAME].strip()
+        if not name:
+            return self.async_abort(reason="name_empty")
+        await self.async_set_unique_id(zone_unique_id(name))
+        self._abort_if_unique_id_configured()
+        data = {
+            CONF_NAME: name,
+            CONF_TEMP_SENSOR_ENTITY: import_data[CONF_TEMP_SENSOR_ENTITY],
+            CONF_HEATER_SWITCH_ENTITY: import_data[CONF_HEATER_SWITCH_ENTITY],
+            CONF_HYSTERESIS: import_data.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+            CONF_TARGET_TEMP: import_data.get(CONF_TARGET_TEMP, DEFAULT_TARGET_TEMP),
+            CONF_MASTER_ENABLED: import_data.get(CONF_MASTER_ENABLED, True),
+        }
+        return self.async_create_entry(title=name, data=data)
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: config_entries.ConfigEntry):
@@ -87,6 +119,9 @@ class VarmegolvOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_HEATER_SWITCH_ENTITY: user_input.get(CONF_HEATER_SWITCH_ENTITY),
                 CONF_HYSTERESIS: user_input.get(CONF_HYSTERESIS),
                 CONF_MASTER_ENABLED: user_input.get(CONF_MASTER_ENABLED),
+                CONF_WINDOW_SLOPE_THRESHOLD: user_input.get(CONF_WINDOW_SLOPE_THRESHOLD),
+                CONF_WINDOW_DETECTION_MINUTES: user_input.get(CONF_WINDOW_DETECTION_MINUTES),
+                CONF_WINDOW_PAUSE_MINUTES: user_input.get(CONF_WINDOW_PAUSE_MINUTES),
             }
             return self.async_create_entry(title="", data=options_data_to_save)
 
@@ -102,6 +137,9 @@ class VarmegolvOptionsFlowHandler(config_entries.OptionsFlow):
             ),
             vol.Optional(CONF_HYSTERESIS, default=self.current_data.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)): vol.Coerce(float),
             vol.Optional(CONF_MASTER_ENABLED, default=self.current_data.get(CONF_MASTER_ENABLED, True)): bool,
+            vol.Optional(CONF_WINDOW_SLOPE_THRESHOLD, default=self.current_data.get(CONF_WINDOW_SLOPE_THRESHOLD, DEFAULT_WINDOW_SLOPE_THRESHOLD)): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(CONF_WINDOW_DETECTION_MINUTES, default=self.current_data.get(CONF_WINDOW_DETECTION_MINUTES, DEFAULT_WINDOW_DETECTION_MINUTES)): vol.All(vol.Coerce(float), vol.Range(min=1)),
+            vol.Optional(CONF_WINDOW_PAUSE_MINUTES, default=self.current_data.get(CONF_WINDOW_PAUSE_MINUTES, DEFAULT_WINDOW_PAUSE_MINUTES)): vol.All(vol.Coerce(float), vol.Range(min=1)),
         })
 
         return self.async_show_form(
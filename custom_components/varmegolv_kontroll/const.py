@@ -6,6 +6,10 @@ Versionshistorik:
 CONF_THERMOSTAT_ENTITY borttagen.
 Lade till DEFAULT_TARGET_TEMP.
 2.1.0 - 2025-05-23 - Lade till CONF_NAME för unika instansnamn.
+2.6.0 - 2026-10-19 - Lade till nycklar och standardvärden för detektering av öppet fönster.
+                     Gemensam zone_device_info() för zonens entiteter.
+2.7.0 - 2026-10-19 - Lade till CONF_ZONES och SERVICE_BULK_CONFIGURE för massprovisionering av zoner.
+                     CONF_PENDING_TARGET_TEMP för måltemperatur till zoner utan aktiv entitet.
 """
 
 DOMAIN = "varmegolv_kontroll"
@@ -17,8 +21,29 @@ CONF_HYSTERESIS = "hysteresis"
 CONF_MASTER_ENABLED = "master_enabled"
 CONF_TARGET_TEMP = "target_temp"
 CONF_NAME = "name" # Nyckel för namnet på instansen
+CONF_WINDOW_SLOPE_THRESHOLD = "window_slope_threshold" # °C/min, 0 (standard) stänger av detekteringen
+CONF_WINDOW_DETECTION_MINUTES = "window_detection_minutes" # Längd på glidande regressionsfönster
+CONF_WINDOW_PAUSE_MINUTES = "window_pause_minutes" # Hur länge värmen pausas vid öppet fönster
+CONF_ZONES = "zones" # Lista med zondefinitioner för import/massuppdatering
+CONF_PENDING_TARGET_TEMP = "pending_target_temp" # Måltemp som appliceras före återställt tillstånd
+
+# Tjänster
+SERVICE_BULK_CONFIGURE = "bulk_configure"
 
 # Standardvärden
 DEFAULT_NAME = "Golvvärmekontroll"
 DEFAULT_HYSTERESIS = 0.5
-DEFAULT_TARGET_TEMP = 20.0
\ No newline at end of file
+DEFAULT_TARGET_TEMP = 20.0
+DEFAULT_WINDOW_SLOPE_THRESHOLD = 0.0 # Av som standard, även för befintliga poster
+DEFAULT_WINDOW_DETECTION_MINUTES = 10
+DEFAULT_WINDOW_PAUSE_MINUTES = 30
+
+# Dispatcher-signal (formateras med entry_id) för öppet fönster-status
+SIGNAL_OPEN_WINDOW = f"{DOMAIN}_open_window_{{}}"
+# Nyckel i hass.data[DOMAIN][entry_id] med aktuell öppet fönster-status
+DATA_OPEN_WINDOW = "open_window"
+
+
+def zone_device_info(config_entry) -> dict:
+    """Gemensam device_info för alla entiteter som hör till en zon."""
+    return {"identifiers": {(DOMAIN, config_entry.entry_id)}, "name": config_entry.title, "manufacturer": "Anpassad Komponent AB", "model": "Golvvärmetermostat v2.2", "sw_version": config_entry.version}
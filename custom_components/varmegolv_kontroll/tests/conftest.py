@@ -6,6 +6,7 @@ from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
+from homeassistant.core import ServiceCall
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
@@ -36,6 +37,28 @@ def skip_notifications_fixture():
         yield
 
 
+@pytest.fixture
+def mock_switch_services(hass):
+    """Registrerar switch.turn_on/turn_off som sätter tillståndet på anropad entitet.
+
+    Returnerar en lista med alla anrop som (tjänst, entity_id).
+    """
+    calls = []
+
+    def _register(service, new_state):
+        async def _handle(call: ServiceCall) -> None:
+            entity_ids = call.data["entity_id"]
+            for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+                calls.append((service, entity_id))
+                hass.states.async_set(entity_id, new_state)
+
+        hass.services.async_register("switch", service, _handle)
+
+    _register("turn_on", "on")
+    _register("turn_off", "off")
+    return calls
+
+
 @pytest.fixture(autouse=True)
 async def ensure_cleanup(hass):
     """Försök tvinga fram cleanup av timers och dölj kända lingering threads.
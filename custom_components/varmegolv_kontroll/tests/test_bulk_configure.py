@@ -0,0 +1,204 @@
+# Version: 2026-10-19 - Tester för tjänsten bulk_configure och YAML-import av zoner.
+"""Testar massprovisionering och massuppdatering av zoner för Golvvärmekontroll."""
+from unittest.mock import patch
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, mock_restore_cache
+
+from homeassistant.config_entries import ConfigEntryDisabler, SOURCE_IMPORT
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.varmegolv_kontroll import async_unload_entry
+from custom_components.varmegolv_kontroll.config_flow import zone_unique_id
+from custom_components.varmegolv_kontroll.const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_TEMP_SENSOR_ENTITY,
+    CONF_HEATER_SWITCH_ENTITY,
+    CONF_HYSTERESIS,
+    CONF_TARGET_TEMP,
+    CONF_MASTER_ENABLED,
+    CONF_ZONES,
+    CONF_PENDING_TARGET_TEMP,
+    SERVICE_BULK_CONFIGURE,
+)
+
+ZONES = [
+    {
+        CONF_NAME: "Badrum",
+        CONF_TEMP_SENSOR_ENTITY: "sensor.badrum_temp",
+        CONF_HEATER_SWITCH_ENTITY: "switch.badrum_golvvarme",
+        CONF_HYSTERESIS: 0.5,
+        CONF_TARGET_TEMP: 22.0,
+    },
+    {
+        CONF_NAME: "Hall",
+        CONF_TEMP_SENSOR_ENTITY: "sensor.hall_temp",
+        CONF_HEATER_SWITCH_ENTITY: "switch.hall_golvvarme",
+    },
+]
+
+def _badrum_entry(**kwargs) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        title="Badrum",
+        unique_id=zone_unique_id("Badrum"),
+        data={**ZONES[0], CONF_TARGET_TEMP: 20.0, CONF_MASTER_ENABLED: True},
+        **kwargs,
+    )
+
+@pytest.mark.asyncio
+async def test_bulk_configure_creates_and_updates_zones(hass: HomeAssistant) -> None:
+    """Nya zoner skapas och befintliga uppdateras via options utan att nya entries skapas."""
+    with patch(
+        "custom_components.varmegolv_kontroll.async_setup_entry", return_value=True
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.services.async_call(DOMAIN, SERVICE_BULK_CONFIGURE, {CONF_ZONES: ZONES}, blocking=True)
+        await hass.async_block_till_done()
+
+        entries = {entry.unique_id: entry for entry in hass.config_entries.async_entries(DOMAIN)}
+        assert set(entries) == {zone_unique_id("Badrum"), zone_unique_id("Hall")}
+        assert entries[zone_unique_id("Badrum")].data[CONF_TARGET_TEMP] == 22.0
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_BULK_CONFIGURE,
+            {CONF_ZONES: [{CONF_NAME: "Hall", CONF_HYSTERESIS: 1.0}]},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 2
+    hall = entries[zone_unique_id("Hall")]
+    assert hall.options[CONF_HYSTERESIS] == 1.0
+
+@pytest.mark.asyncio
+async def test_bulk_configure_rejects_whole_batch_on_error(hass: HomeAssistant) -> None:
+    """Dubbletter av unikt ID avvisar hela listan innan något skapas."""
+    duplicate = {**ZONES[0], CONF_NAME: "badrum"}
+    with patch(
+        "custom_components.varmegolv_kontroll.async_setup_entry", return_value=True
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_BULK_CONFIGURE, {CONF_ZONES: [*ZONES, duplicate]}, blocking=True
+            )
+        await hass.async_block_till_done()
+
+    assert hass.config_entries.async_entries(DOMAIN) == []
+
+@pytest.mark.asyncio
+async def test_bulk_configure_updates_live_entity_without_reload(hass: HomeAssistant, mock_switch_services) -> None:
+    """Hysteres och måltemperatur appliceras på den laddade entiteten utan omladdning."""
+    hass.states.async_set("sensor.badrum_temp", "22.0")
+    hass.states.async_set("switch.badrum_golvvarme", "off")
+    entry = _badrum_entry()
+    entry.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    climate_entity_id = er.async_get(hass).async_get_entity_id("climate", DOMAIN, f"{entry.entry_id}_thermostat")
+    assert hass.states.get(climate_entity_id).attributes[ATTR_TEMPERATURE] == 20.0
+
+    with patch(
+        "custom_components.varmegolv_kontroll.async_unload_entry", wraps=async_unload_entry
+    ) as mock_unload:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_BULK_CONFIGURE,
+            {CONF_ZONES: [{CONF_NAME: "Badrum", CONF_HYSTERESIS: 1.0, CONF_TARGET_TEMP: 22.0}]},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get(climate_entity_id).attributes[ATTR_TEMPERATURE] == 22.0
+        assert entry.options[CONF_HYSTERESIS] == 1.0
+
+        # Användaren ändrar på termostatkortet; samma bulk-körning igen ska återställa målet.
+        await hass.services.async_call(
+            "climate", "set_temperature", {"entity_id": climate_entity_id, ATTR_TEMPERATURE: 21.0}, blocking=True
+        )
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_BULK_CONFIGURE,
+            {CONF_ZONES: [{CONF_NAME: "Badrum", CONF_HYSTERESIS: 1.0, CONF_TARGET_TEMP: 22.0}]},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get(climate_entity_id).attributes[ATTR_TEMPERATURE] == 22.0
+
+        # Sensorlyssnaren lever kvar och styr med ny hysteres (påslag under 22.0 - 1.0/2 = 21.5).
+        hass.states.async_set("sensor.badrum_temp", "21.6")
+        await hass.async_block_till_done()
+        assert hass.states.get(climate_entity_id).attributes["current_temperature"] == 21.6
+        assert ("turn_on", "switch.badrum_golvvarme") not in mock_switch_services
+        hass.states.async_set("sensor.badrum_temp", "21.4")
+        await hass.async_block_till_done()
+        assert ("turn_on", "switch.badrum_golvvarme") in mock_switch_services
+
+    mock_unload.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_yaml_import_creates_only_missing_zones(hass: HomeAssistant) -> None:
+    """YAML-zoner skapar saknade poster men skriver inte över befintliga."""
+    entry = _badrum_entry()
+    entry.add_to_hass(hass)
+    yaml_zones = [{**ZONES[0], CONF_TARGET_TEMP: 25.0}, ZONES[1]]
+    with patch(
+        "custom_components.varmegolv_kontroll.async_setup_entry", return_value=True
+    ):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {CONF_ZONES: yaml_zones}})
+        await hass.async_block_till_done()
+
+    entries = {entry.unique_id: entry for entry in hass.config_entries.async_entries(DOMAIN)}
+    assert set(entries) == {zone_unique_id("Badrum"), zone_unique_id("Hall")}
+    assert entries[zone_unique_id("Hall")].source == SOURCE_IMPORT
+    assert entry.data[CONF_TARGET_TEMP] == 20.0
+    assert entry.options == {}
+
+@pytest.mark.asyncio
+async def test_pending_target_wins_over_restored_state(hass: HomeAssistant, mock_switch_services) -> None:
+    """Måltemperatur till en avstängd zon appliceras före återställt tillstånd när zonen startar."""
+    hass.states.async_set("sensor.badrum_temp", "22.0")
+    hass.states.async_set("switch.badrum_golvvarme", "off")
+    mock_restore_cache(hass, [State("climate.badrum", "heat", {ATTR_TEMPERATURE: 19.0, "hvac_mode": "heat"})])
+    entry = _badrum_entry(disabled_by=ConfigEntryDisabler.USER)
+    entry.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.services.async_call(
+        DOMAIN, SERVICE_BULK_CONFIGURE, {CONF_ZONES: [{CONF_NAME: "Badrum", CONF_TARGET_TEMP: 23.0}]}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert entry.data[CONF_PENDING_TARGET_TEMP] == 23.0
+
+    await hass.config_entries.async_set_disabled_by(entry.entry_id, None)
+    await hass.async_block_till_done()
+    climate_entity_id = er.async_get(hass).async_get_entity_id("climate", DOMAIN, f"{entry.entry_id}_thermostat")
+    assert climate_entity_id == "climate.badrum"
+    assert hass.states.get(climate_entity_id).attributes[ATTR_TEMPERATURE] == 23.0
+    assert CONF_PENDING_TARGET_TEMP not in entry.data
+
+@pytest.mark.asyncio
+async def test_target_out_of_range_rejects_whole_batch(hass: HomeAssistant) -> None:
+    """En måltemperatur utanför termostatens min/max avvisar listan innan något ändras."""
+    entry = _badrum_entry()
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.varmegolv_kontroll.async_setup_entry", return_value=True
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_BULK_CONFIGURE,
+                {CONF_ZONES: [{CONF_NAME: "Badrum", CONF_HYSTERESIS: 1.0}, {**ZONES[1], CONF_TARGET_TEMP: 50.0}]},
+                blocking=True,
+            )
+        await hass.async_block_till_done()
+
+    assert entry.options == {}
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 1
@@ -0,0 +1,141 @@
+# Version: 2026-10-19 - Tester för detektering av öppet fönster med riktig climate-entitet.
+"""Testar att värmen pausas och återupptas vid detekterat öppet fönster."""
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.varmegolv_kontroll.binary_sensor import VarmegolvOpenWindowBinarySensor
+from custom_components.varmegolv_kontroll.const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_TEMP_SENSOR_ENTITY,
+    CONF_HEATER_SWITCH_ENTITY,
+    CONF_HYSTERESIS,
+    CONF_TARGET_TEMP,
+    CONF_MASTER_ENABLED,
+    CONF_WINDOW_SLOPE_THRESHOLD,
+    CONF_WINDOW_DETECTION_MINUTES,
+    CONF_WINDOW_PAUSE_MINUTES,
+)
+
+SENSOR = "sensor.badrum_temp"
+SWITCH = "switch.badrum_golvvarme"
+
+WINDOW_OPTIONS = {
+    CONF_WINDOW_SLOPE_THRESHOLD: 0.1,
+    CONF_WINDOW_DETECTION_MINUTES: 10,
+    CONF_WINDOW_PAUSE_MINUTES: 30,
+}
+
+
+async def _setup_zone(hass: HomeAssistant) -> tuple:
+    """Sätter upp en zon med riktig climate- och binary_sensor-entitet."""
+    hass.states.async_set(SENSOR, "22.0")
+    hass.states.async_set(SWITCH, "off")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        title="Badrum",
+        unique_id=f"{DOMAIN}_badrum",
+        data={
+            CONF_NAME: "Badrum",
+            CONF_TEMP_SENSOR_ENTITY: SENSOR,
+            CONF_HEATER_SWITCH_ENTITY: SWITCH,
+            CONF_HYSTERESIS: 0.5,
+            CONF_TARGET_TEMP: 22.0,
+            CONF_MASTER_ENABLED: True,
+        },
+        options=WINDOW_OPTIONS,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    registry = er.async_get(hass)
+    window_entity_id = registry.async_get_entity_id("binary_sensor", DOMAIN, f"{entry.entry_id}_open_window")
+    assert window_entity_id is not None
+    return entry, window_entity_id
+
+
+async def _drop_temperature(hass: HomeAssistant, freezer, start: float, minutes: int, per_minute: float) -> float:
+    """Sänker sensorvärdet en gång per minut och returnerar sista värdet."""
+    temp = start
+    for _ in range(minutes):
+        freezer.tick(timedelta(minutes=1))
+        temp = round(temp - per_minute, 2)
+        hass.states.async_set(SENSOR, str(temp))
+        await hass.async_block_till_done()
+    return temp
+
+
+@pytest.mark.asyncio
+async def test_open_window_pauses_and_resumes_heating(hass: HomeAssistant, freezer, mock_switch_services) -> None:
+    """Snabbt fall pausar värmen, blockerar påslag under pausen och återupptar efteråt."""
+    _, window_entity_id = await _setup_zone(hass)
+    assert hass.states.get(window_entity_id).state == "off"
+
+    # Första minuten slår värmen på (under mål - hysteres/2), sedan detekteras fönstret.
+    temp = await _drop_temperature(hass, freezer, 22.0, 6, 0.3)
+    assert ("turn_on", SWITCH) in mock_switch_services
+    assert hass.states.get(window_entity_id).state == "on"
+    assert hass.states.get(SWITCH).state == "off"
+
+    # Fortsatt kallt under pausen: värmen får inte slås på igen.
+    mock_switch_services.clear()
+    await _drop_temperature(hass, freezer, temp, 3, 0.1)
+    assert ("turn_on", SWITCH) not in mock_switch_services
+    assert hass.states.get(SWITCH).state == "off"
+
+    # Pausen löper ut: styrningen återupptas och värmen slås på.
+    freezer.tick(timedelta(minutes=30))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert hass.states.get(window_entity_id).state == "off"
+    assert hass.states.get(SWITCH).state == "on"
+
+
+@pytest.mark.asyncio
+async def test_sensor_jitter_does_not_pause(hass: HomeAssistant, freezer, mock_switch_services) -> None:
+    """Kvantiseringsbrus under några sekunder ska inte detekteras som öppet fönster."""
+    _, window_entity_id = await _setup_zone(hass)
+    for seconds, temp in [(20, "21.9"), (5, "22.0"), (5, "21.9"), (5, "22.0"), (5, "21.9")]:
+        freezer.tick(timedelta(seconds=seconds))
+        hass.states.async_set(SENSOR, temp)
+        await hass.async_block_till_done()
+    assert hass.states.get(window_entity_id).state == "off"
+
+
+@pytest.mark.asyncio
+async def test_threshold_zero_ends_active_pause(hass: HomeAssistant, freezer, mock_switch_services) -> None:
+    """Gräns 0 i options avslutar en pågående paus och återupptar styrningen direkt."""
+    entry, window_entity_id = await _setup_zone(hass)
+    await _drop_temperature(hass, freezer, 22.0, 6, 0.3)
+    assert hass.states.get(window_entity_id).state == "on"
+    assert hass.states.get(SWITCH).state == "off"
+
+    hass.config_entries.async_update_entry(entry, options={**entry.options, CONF_WINDOW_SLOPE_THRESHOLD: 0.0})
+    await hass.async_block_till_done()
+    assert hass.states.get(window_entity_id).state == "off"
+    assert hass.states.get(SWITCH).state == "on"
+
+
+@pytest.mark.asyncio
+async def test_binary_sensor_added_during_pause_shows_on(hass: HomeAssistant, freezer, mock_switch_services) -> None:
+    """En binary_sensor som läggs till under en pågående paus visar direkt 'på'."""
+    entry, window_entity_id = await _setup_zone(hass)
+    await _drop_temperature(hass, freezer, 22.0, 6, 0.3)
+    assert hass.states.get(window_entity_id).state == "on"
+
+    late_sensor = VarmegolvOpenWindowBinarySensor(entry)
+    late_sensor.hass = hass
+    # Ingen riktig dispatcher-koppling: sensorn läggs aldrig till i en plattform.
+    with patch(
+        "custom_components.varmegolv_kontroll.binary_sensor.async_dispatcher_connect", return_value=lambda: None
+    ):
+        await late_sensor.async_added_to_hass()
+    assert late_sensor.is_on is True
@@ -0,0 +1,60 @@
+# Version: 2026-10-19 - Tester för glidande regression vid detektering av öppet fönster.
+"""Testar SlidingSlope som används för detektering av öppet fönster."""
+import pytest
+
+from custom_components.varmegolv_kontroll.window_detection import SlidingSlope
+
+
+def test_slope_requires_min_samples() -> None:
+    """Ingen lutning returneras förrän tillräckligt många punkter finns."""
+    window = SlidingSlope(window_minutes=2)
+    assert window.add(0, 22.0) is None
+    assert window.add(60, 21.9) is None
+    assert window.add(120, 21.8) == pytest.approx(-0.1)
+
+
+def test_sensor_jitter_gives_no_slope() -> None:
+    """Snabbt brus (kvantiseringsflimmer) under kort tid ger ingen lutning."""
+    window = SlidingSlope(window_minutes=10)
+    for seconds, temp in [(0, 22.0), (20, 21.9), (25, 22.0), (30, 21.9)]:
+        slope = window.add(seconds, temp)
+    assert slope is None
+
+
+def test_slope_requires_half_window_span() -> None:
+    """Lutning returneras först när punkterna täcker minst halva fönstret."""
+    window = SlidingSlope(window_minutes=10)
+    for minute in range(5):
+        assert window.add(minute * 60, 22.0 - 0.2 * minute) is None
+    assert window.add(5 * 60, 21.0) == pytest.approx(-0.2)
+
+
+def test_old_samples_leave_window() -> None:
+    """Punkter äldre än fönstret tas bort och påverkar inte lutningen."""
+    window = SlidingSlope(window_minutes=5)
+    # Snabbt fall först, sedan stabil temperatur längre än fönstret
+    for minute, temp in enumerate([22.0, 21.0, 20.0]):
+        window.add(minute * 60, temp)
+    for minute in range(3, 12):
+        slope = window.add(minute * 60, 20.0)
+    assert len(window) == 6
+    assert slope == pytest.approx(0.0)
+
+
+def test_rebase_keeps_slope_accurate() -> None:
+    """Långa körningar räknar om origo utan att lutningen påverkas."""
+    window = SlidingSlope(window_minutes=10)
+    start = 1_700_000_000.0
+    for minute in range(3 * 24 * 60):
+        slope = window.add(start + minute * 60, 20.0 + 0.05 * minute)
+    assert slope == pytest.approx(0.05)
+
+
+def test_reset_clears_samples() -> None:
+    """reset() tömmer fönstret."""
+    window = SlidingSlope(window_minutes=10)
+    for minute in range(5):
+        window.add(minute * 60, 20.0)
+    window.reset()
+    assert len(window) == 0
+    assert window.slope is None
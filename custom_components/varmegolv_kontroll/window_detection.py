@@ -0,0 +1,97 @@
+"""
+Detektering av öppet fönster för Golvvärmekontroll.
+
+Versionshistorik:
+2.6.0 - 2026-10-19 - Initialversion. Glidande linjär regression med löpande summor
+                     så att varje ny mätpunkt kostar konstant tid (amorterat). Lutning returneras
+                     först när punkterna täcker minst halva fönstret, så att sensorbrus inte räknas.
+"""
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+# Om fönstrets första punkt ligger längre än så här från origo (minuter) räknas
+# summorna om från ett nytt origo, för att undvika precisionsförlust i float.
+_REBASE_AFTER_MINUTES = 24 * 60
+
+
+class SlidingSlope:
+    """Minsta-kvadrat-lutning (°C/min) över de senaste `window_minutes` minuterna.
+
+    Ingen lutning returneras förrän punkterna spänner över minst halva fönstret.
+    """
+
+    def __init__(self, window_minutes: float, min_samples: int = 3) -> None:
+        self._window_minutes = float(window_minutes)
+        self._min_samples = min_samples
+        self._samples: Deque[Tuple[float, float]] = deque()  # (tidsstämpel i sekunder, värde)
+        self._origin: Optional[float] = None
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+
+    @property
+    def window_minutes(self) -> float:
+        return self._window_minutes
+
+    @window_minutes.setter
+    def window_minutes(self, value: float) -> None:
+        self._window_minutes = float(value)
+        if self._samples:
+            self._trim(self._x(self._samples[-1][0]))
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._origin = None
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+
+    def add(self, timestamp: float, value: float) -> Optional[float]:
+        """Lägg till en mätpunkt (tidsstämpel i sekunder) och returnera aktuell lutning."""
+        if self._samples and timestamp <= self._samples[-1][0]:
+            return self.slope
+        if self._origin is None:
+            self._origin = timestamp
+        x = self._x(timestamp)
+        self._samples.append((timestamp, value))
+        self._sum_x += x
+        self._sum_y += value
+        self._sum_xx += x * x
+        self._sum_xy += x * value
+        self._trim(x)
+        if self._x(self._samples[0][0]) > _REBASE_AFTER_MINUTES:
+            self._rebase()
+        return self.slope
+
+    @property
+    def slope(self) -> Optional[float]:
+        n = len(self._samples)
+        if n < self._min_samples:
+            return None
+        span = self._x(self._samples[-1][0]) - self._x(self._samples[0][0])
+        if span < self._window_minutes / 2:
+            return None
+        denominator = n * self._sum_xx - self._sum_x * self._sum_x
+        if denominator <= 1e-9:
+            return None
+        return (n * self._sum_xy - self._sum_x * self._sum_y) / denominator
+
+    def _x(self, timestamp: float) -> float:
+        return (timestamp - self._origin) / 60.0
+
+    def _trim(self, newest_x: float) -> None:
+        while self._samples and newest_x - self._x(self._samples[0][0]) > self._window_minutes:
+            old_timestamp, old_value = self._samples.popleft()
+            old_x = self._x(old_timestamp)
+            self._sum_x -= old_x
+            self._sum_y -= old_value
+            self._sum_xx -= old_x * old_x
+            self._sum_xy -= old_x * old_value
+
+    def _rebase(self) -> None:
+        samples = list(self._samples)
+        self.reset()
+        for timestamp, value in samples:
+            self.add(timestamp, value)